@@ -1,4 +1,6 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Config(BaseSettings):
@@ -8,10 +10,31 @@ class Config(BaseSettings):
     project_path: str
     microsoft_teams_webhook: str
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        env_nested_delimiter = "__"
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", env_nested_delimiter="__"
+    )
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Config:
+    """
+    Loads the settings on first use, later calls return the same instance.
+
+    Returns:
+        Config: The application settings.
+    """
+    return Config()
+
+
+@lru_cache(maxsize=None)
+def get_resources_dir(kind: str) -> str:
+    """
+    Returns the folder holding one kind of resource, eg: "jobs" or "suites".
 
+    Args:
+        kind (str): The name of the resource folder.
 
-settings = Config()
+    Returns:
+        str: The path to the resource folder.
+    """
+    return f"{get_settings().project_path}/resources/{kind}"
@@ -1,6 +1,5 @@
 from datetime import datetime
-import os
-from typing import List, Union
+from typing import Any, Dict, Iterator, List, Tuple, Union
 import yaml
 import argparse
 
@@ -17,7 +16,25 @@ from models.job import Job
 
 from utils.job_selector_factory import JobSelectorFactory
 from utils.logger import logger
-from core.config import settings
+from utils.yaml_loader import load_yaml_cached
+from core.config import get_resources_dir, get_settings
+
+
+# (context, data source) last registered for each name. The context itself is
+# held, so a hit is an identity check against a live object.
+_data_sources: Dict[str, Tuple[FileDataContext, Any]] = {}
+
+_BASE_ACTIONS = (
+    {
+        "name": "store_validation_result",
+        "action": {"class_name": "StoreValidationResultAction"},
+    },
+    {
+        "name": "store_evaluation_params",
+        "action": {"class_name": "StoreEvaluationParametersAction"},
+    },
+    {"name": "update_data_docs", "action": {"class_name": "UpdateDataDocsAction"}},
+)
 
 
 def parse_arguments():
@@ -44,21 +61,24 @@ def load_context(project_path, runtime_environment=None):
 
 def load_data_source(context: FileDataContext, ds_name):
     """
-    Loads the data source.
+    Loads the data source. The data source is registered once per context,
+    later calls with the same context and name return the same data source.
 
     Args:
         context (gx.data_context.DataContext): The Great Expectations context.
-        env (str): The environment.
+        ds_name (str): The name of the data source configuration file.
     """
-    data_source_path = os.path.join(
-        project_path, "resources/data_sources", f"{ds_name}.yml"
-    )
-    with open(data_source_path, "r") as file:
-        data_source_params = yaml.safe_load(file)
-    return context.sources.add_or_update_postgres(
+    cached = _data_sources.get(ds_name)
+    if cached is not None and cached[0] is context:
+        return cached[1]
+    data_source_path = f"{get_resources_dir('data_sources')}/{ds_name}.yml"
+    data_source_params = load_yaml_cached(data_source_path)
+    data_source = context.sources.add_or_update_postgres(
         data_source_params["name"],
         connection_string=data_source_params["connection_string"],
     )
+    _data_sources[ds_name] = (context, data_source)
+    return data_source
 
 
 def build_suite(context, suite_config: Suite):
@@ -74,11 +94,18 @@ def build_suite(context, suite_config: Suite):
     """
     suite_name = suite_config.name
     suite = context.add_or_update_expectation_suite(expectation_suite_name=suite_name)
-    for expectation in suite_config.expectations:
-        expectation = ExpectationConfiguration(
-            expectation_type=expectation.expectation_type, kwargs=expectation.kwargs
-        )
-        suite.add_expectation(expectation)
+    # bind the constructor locally to skip the global lookup per expectation
+    config = ExpectationConfiguration
+    # added in bulk, each expectation is still validated and upserted by domain
+    suite.add_expectation_configurations(
+        [
+            config(
+                expectation_type=expectation.expectation_type,
+                kwargs=expectation.kwargs,
+            )
+            for expectation in suite_config.expectations
+        ]
+    )
     context.update_expectation_suite(suite)
     return suite_name
 
@@ -98,7 +125,9 @@ def log_jobs_run(jobs: List[Job]):
     logger.info("%s", "========================================================")
 
 
-def build_validations(context, data_source, jobs: Union[Job, List[Job]]):
+def build_validations(
+    context, data_source, jobs: Union[Job, List[Job]]
+) -> Iterator[dict]:
     """
     Builds validations for the given jobs.
 
@@ -107,10 +136,14 @@ def build_validations(context, data_source, jobs: Union[Job, List[Job]]):
         data_source: The data source.
         jobs (Union[Job, List[Job]]): The job or list of jobs.
 
-    Returns:
-        List[dict]: The list of validations.
+    Yields:
+        dict: The validations, one per data asset of each run.
     """
-    validations = []
+    # suites are built once per name, even when shared by several runs
+    built_suites: Dict[str, str] = {}
+    # data assets are looked up in the data source once per name
+    data_assets: Dict[str, Any] = {}
+    known_assets = {asset.name for asset in data_source.assets}
 
     if isinstance(jobs, Job):
         jobs = [jobs]
@@ -119,23 +152,26 @@ def build_validations(context, data_source, jobs: Union[Job, List[Job]]):
 
     for job in jobs:
         for run in job.runs:
+            suite_name = built_suites.get(run.suite.name)
+            if suite_name is None:
+                suite_name = build_suite(context, run.suite)
+                built_suites[run.suite.name] = suite_name
             for data_asset_config in run.data_assets:
                 # find asset with name, if not found then create one.
-                try:
-                    data_asset = data_source.get_asset(data_asset_config.name)
-                except:
-                    data_asset = data_source.add_query_asset(
-                        name=data_asset_config.name, query=data_asset_config.query
-                    )
+                data_asset = data_assets.get(data_asset_config.name)
+                if data_asset is None:
+                    if data_asset_config.name in known_assets:
+                        data_asset = data_source.get_asset(data_asset_config.name)
+                    else:
+                        data_asset = data_source.add_query_asset(
+                            name=data_asset_config.name, query=data_asset_config.query
+                        )
+                    data_assets[data_asset_config.name] = data_asset
                 batch_request = data_asset.build_batch_request()
-                suite_name = build_suite(context, run.suite)
-                validations.append(
-                    {
-                        "batch_request": batch_request,
-                        "expectation_suite_name": suite_name,
-                    }
-                )
-    return validations
+                yield {
+                    "batch_request": batch_request,
+                    "expectation_suite_name": suite_name,
+                }
 
 
 def build_teams_noti_action(notify_on: str, webhook: str) -> ActionDict:
@@ -162,7 +198,7 @@ def build_teams_noti_action(notify_on: str, webhook: str) -> ActionDict:
     }
 
 
-def run_checkpoint(context, job_name, validations, webhook):
+def run_checkpoint(context, job_name, validations, action_list):
     """
     Runs a checkpoint.
 
@@ -170,25 +206,10 @@ def run_checkpoint(context, job_name, validations, webhook):
         context: The Great Expectations context.
         job_name (StrictStr): The name of the job.
         validations (List[dict]): The list of validations.
-        webhook: The Microsoft Teams webhook for trigger notification
+        action_list (List[ActionDict]): The actions to run after validation.
     Returns:
         gx.checkpoint.CheckpointResult: The result of the checkpoint run.
     """
-
-    action_list = [
-        {
-            "name": "store_validation_result",
-            "action": {"class_name": "StoreValidationResultAction"},
-        },
-        {
-            "name": "store_evaluation_params",
-            "action": {"class_name": "StoreEvaluationParametersAction"},
-        },
-        {"name": "update_data_docs", "action": {"class_name": "UpdateDataDocsAction"}},
-    ]
-
-    action_list.append(build_teams_noti_action("failure", webhook))
-
     checkpoint = context.add_or_update_checkpoint(
         name=job_name,
         run_name_template=job_name,
@@ -200,28 +221,32 @@ def run_checkpoint(context, job_name, validations, webhook):
 
 if __name__ == "__main__":
     args = parse_arguments()
+    settings = get_settings()
     env = settings.env
     project_path = settings.project_path
     webhook = args.webhook if args.webhook else settings.microsoft_teams_webhook
     logger.info("Job name: %s", args.job_name)
     logger.info("Tags: %s", args.job_tags)
     logger.info("Using webhook: %s", webhook)
+    action_list = list(_BASE_ACTIONS) + [build_teams_noti_action("failure", webhook)]
+    if not yaml.__with_libyaml__:
+        logger.warning("libyaml is not available, falling back to pure-Python YAML")
 
     try:
         context = load_context(project_path, runtime_environment={"ENV": env})
         data_source = load_data_source(context, "staging_postgres")
         if args.job_name:
             jobs = JobSelectorFactory.select_job(args.job_name)
-            validations = build_validations(context, data_source, jobs)
+            validations = list(build_validations(context, data_source, jobs))
             checkpoint_result = run_checkpoint(
-                context, args.job_name, validations, webhook
+                context, args.job_name, validations, action_list
             )
         elif args.job_tags:
             tags_list = args.job_tags.split("-")
             jobs = JobSelectorFactory.select_job(tags_list)
-            validations = build_validations(context, data_source, jobs)
+            validations = list(build_validations(context, data_source, jobs))
             checkpoint_result = run_checkpoint(
-                context, args.job_tags, validations, webhook
+                context, args.job_tags, validations, action_list
             )
         else:
             raise Exception("No job name or tags provided")
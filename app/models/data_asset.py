@@ -1,6 +1,8 @@
-from pydantic import BaseModel, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictStr
 
 
 class DataAsset(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: StrictStr
     query: StrictStr
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from pydantic import BaseModel, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictStr
 
 from models.suite import Suite
 from models.data_asset import DataAsset
@@ -14,6 +14,8 @@ class Run(BaseModel):
         suite (Suite): The suite configuration for the run.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     data_assets: List[DataAsset]
     suite: Suite
 
@@ -28,6 +30,8 @@ class Job(BaseModel):
         tags (Optional[List[StrictStr]]): A list of tags for the job.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: StrictStr
     runs: List[Run]
     tags: Optional[List[StrictStr]]
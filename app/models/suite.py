@@ -1,5 +1,5 @@
 from typing import List
-from pydantic import BaseModel, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictStr
 
 
 class Expectation(BaseModel):
@@ -11,6 +11,8 @@ class Expectation(BaseModel):
         kwargs (dict): Additional keyword arguments for the expectation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     expectation_type: StrictStr
     kwargs: dict
 
@@ -24,5 +26,7 @@ class Suite(BaseModel):
         expectations (List[Expectation]): A list of expectation configurations for the suite.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: StrictStr
     expectations: List[Expectation]
@@ -1,10 +1,17 @@
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import FrozenSet, Iterator, List, Optional, Union
 import os
-from pydantic import StrictStr
-import yaml
+from pydantic import StrictStr, TypeAdapter
 from utils.selector import select_asset, select_suite
 from models.job import Job, Run
-from core.config import settings
+from utils.yaml_loader import load_yaml, load_top_level_list
+from core.config import get_resources_dir
+
+# job files are small and reading them is mostly I/O wait
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+_TAGS_ADAPTER = TypeAdapter(Optional[List[StrictStr]])
 
 
 class JobSelectorFactory:
@@ -43,11 +50,9 @@ class JobSelectorFactory:
         Raises:
             ValueError: If no job is found for the given filename.
         """
-        sub_folder, job_name = fname.split(".")
-        path = os.path.join(
-            settings.project_path, "resources/jobs", sub_folder, job_name + ".yml"
-        )
-        job_data = yaml.safe_load(open(path))
+        sub_folder, _, job_name = fname.partition(".")
+        path = f"{get_resources_dir('jobs')}/{sub_folder}/{job_name}.yml"
+        job_data = load_yaml(path)
         if job_data:
             job = handle_job_data(job_data)
         else:
@@ -69,21 +74,53 @@ class JobSelectorFactory:
             ValueError: If no jobs are found for the given tags.
         """
         jobs = []
-        for root, dirs, files in os.walk(
-            os.path.join(settings.project_path, "resources/jobs")
-        ):
-            for file in files:
-                if file.endswith(".yml"):
-                    file_path = os.path.join(root, file)
-                    job_data = yaml.safe_load(open(file_path))
-                    job = handle_job_data(job_data)
-                    if all(tag in job.tags for tag in tags):
-                        jobs.append(job)
+        paths = list(_iter_yml(get_resources_dir("jobs")))
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            select = partial(_parse_and_filter, tags=frozenset(tags))
+            for job in executor.map(select, paths):
+                if job:
+                    jobs.append(job)
         if len(jobs) == 0:
             raise ValueError(f"No job found for tags: {tags}")
         return jobs
 
 
+def _iter_yml(root: str) -> Iterator[str]:
+    """
+    Yields the paths of all YAML files under a folder, recursively.
+
+    Args:
+        root (str): The folder to walk.
+
+    Yields:
+        str: The paths of the .yml files.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_yml(entry.path)
+            elif entry.name.endswith(".yml"):
+                yield entry.path
+
+
+def _parse_and_filter(path: str, tags: FrozenSet[StrictStr]) -> Optional[Job]:
+    """
+    Creates a Job object from a job file if it has all the given tags.
+
+    Args:
+        path (str): The path to the job configuration file.
+        tags (FrozenSet[StrictStr]): The tags the job must have.
+
+    Returns:
+        Optional[Job]: The Job object, or None if a tag is missing.
+    """
+    # only the tags are read before deciding to build the job
+    job_tags = load_top_level_list(path, "tags")
+    if not tags.issubset(job_tags):
+        return None
+    return handle_job_data(load_yaml(path))
+
+
 def handle_job_data(job_data: dict) -> Job:
     """
     Creates a Job object based on job data.
@@ -93,6 +130,9 @@ def handle_job_data(job_data: dict) -> Job:
 
     Returns:
         Job: A Job object created from the job data.
+
+    Raises:
+        ValidationError: If the tags are not a list of strings.
     """
     runs = []
     for run in job_data.get("runs"):
@@ -101,5 +141,7 @@ def handle_job_data(job_data: dict) -> Job:
             data_asset = select_asset(data_asset_name)
             data_assets.append(data_asset)
         suite = select_suite(run["suite"])
-        runs.append(Run(data_assets=data_assets, suite=suite))
-    return Job(name=job_data.get("name"), runs=runs, tags=job_data.get("tags"))
+        runs.append(Run.model_construct(data_assets=data_assets, suite=suite))
+    # the job is built without validation, but tags drive job selection
+    tags = _TAGS_ADAPTER.validate_python(job_data.get("tags"))
+    return Job.model_construct(name=job_data.get("name"), runs=runs, tags=tags)
@@ -1,9 +1,21 @@
 import logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="""%(asctime)s.%(msecs)d %(levelname)-8s[%(filename)s:%(funcName)s:%(lineno)d] %(message)s""",
+# Caller info (filename, funcName, lineno) is not logged, so skip the frame
+# lookup done for every record, see "Optimization" in the logging HOWTO.
+# This is intentionally process-wide: records of every logger, GX included,
+# no longer carry caller info.
+logging._srcfile = None
+
+_formatter = logging.Formatter(
+    fmt="%(asctime)s.%(msecs)d %(levelname)-8s[%(name)s] %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
+_handler = logging.StreamHandler()
+_handler.setFormatter(_formatter)
+
+_root = logging.getLogger()
+_root.setLevel(logging.INFO)
+_root.addHandler(_handler)
+
 logging.disable(level=logging.DEBUG)
 logger = logging.getLogger("app")
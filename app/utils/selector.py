@@ -1,10 +1,28 @@
-import os
+from functools import lru_cache
+from typing import Dict
 from models.suite import Expectation, Suite
 from models.data_asset import DataAsset
-from core.config import settings
-import yaml
+from core.config import get_resources_dir
+from utils.yaml_loader import load_yaml, load_yaml_cached
 
 
+@lru_cache(maxsize=None)
+def _load_asset_queries(tbl_name: str) -> Dict[str, str]:
+    """
+    Loads the queries of all data assets defined in a data asset file.
+
+    Args:
+        tbl_name (str): The name of the data asset file, without extension.
+
+    Returns:
+        Dict[str, str]: The queries keyed by data asset name.
+    """
+    path = f"{get_resources_dir('data_assets')}/{tbl_name}.yml"
+    assets = load_yaml(path)["data_assets"]
+    return {asset.get("name"): asset["query"] for asset in assets}
+
+
+@lru_cache(maxsize=None)
 def select_asset(fname: str) -> DataAsset:
     """
     Selects a data asset based on the given full name, including subfolder to the file.
@@ -19,17 +37,14 @@ def select_asset(fname: str) -> DataAsset:
     Raises:
         Exception: If the data asset with the given filename is not found.
     """
-    tbl_name, asset_name = fname.split(".")
-    path = os.path.join(
-        settings.project_path, "resources/data_assets", tbl_name + ".yml"
-    )
-    assets = yaml.safe_load(open(path))["data_assets"]
-    for asset in assets:
-        if asset.get("name") == asset_name:
-            return DataAsset(name=fname, query=asset["query"])
-    raise Exception(f"Asset {fname} is not found")
+    tbl_name, _, asset_name = fname.partition(".")
+    query = _load_asset_queries(tbl_name).get(asset_name)
+    if query is None:
+        raise Exception(f"Asset {fname} is not found")
+    return DataAsset.model_construct(name=fname, query=query)
 
 
+@lru_cache(maxsize=None)
 def select_suite(suite_name: str) -> Suite:
     """
     Selects a suite configuration based on the given suite name.
@@ -43,14 +58,17 @@ def select_suite(suite_name: str) -> Suite:
     Raises:
         Exception: If the suite with the given name is not found.
     """
-    path = os.path.join(settings.project_path, "resources/suites", suite_name + ".yml")
-    suite_data = yaml.safe_load(open(path))
+    path = f"{get_resources_dir('suites')}/{suite_name}.yml"
+    suite_data = load_yaml_cached(path)
 
     expectations = []
     for expectation in suite_data.get("expectations"):
         expectation_type = expectation["expectation_type"]
         kwargs = expectation["kwargs"]
-        expectation = Expectation(expectation_type=expectation_type, kwargs=kwargs)
+        expectation = Expectation.model_construct(
+            expectation_type=expectation_type, kwargs=kwargs
+        )
         expectations.append(expectation)
 
-    return Suite(name=suite_data["name"], expectations=expectations)
+    # configs come from the project's own YAML files, validation is skipped
+    return Suite.model_construct(name=suite_data["name"], expectations=expectations)
@@ -0,0 +1,164 @@
+from functools import lru_cache
+from typing import List, Optional
+
+import yaml
+
+# Prefer the libyaml-backed loader, fall back to the pure-Python one.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_NULL_TAG = "tag:yaml.org,2002:null"
+
+
+def load_yaml(path: str):
+    """
+    Loads a YAML file with the safe loader.
+
+    Args:
+        path (str): The path to the YAML file.
+
+    Returns:
+        The parsed content of the file.
+    """
+    with open(path, "rb") as file:
+        return yaml.load(file, Loader=Loader)
+
+
+@lru_cache(maxsize=None)
+def load_yaml_cached(path: str):
+    """
+    Loads a YAML file once per run, subsequent calls return the parsed content.
+    The content is shared between callers and must not be mutated.
+
+    Args:
+        path (str): The path to the YAML file.
+
+    Returns:
+        The parsed content of the file.
+    """
+    return load_yaml(path)
+
+
+def load_top_level_list(path: str, key: str) -> List[str]:
+    """
+    Reads a list of strings stored under a top-level key of a YAML mapping,
+    without constructing the rest of the file.
+
+    The file is only scanned as an event stream when it holds a single plain
+    key with a null or a list of plain strings. Anything else (aliases, merge
+    keys, repeated keys, other value types...) is read with a full parse.
+
+    Args:
+        path (str): The path to the YAML file.
+        key (str): The top-level key holding the list.
+
+    Returns:
+        List[str]: The strings of the list, or an empty list if the key is missing.
+
+    Raises:
+        ValueError: If the value of the key is not a list of strings.
+    """
+    values = _scan_top_level_list(path, key)
+    if values is None:
+        values = load_yaml(path).get(key)
+        if values is None:
+            return []
+        if not isinstance(values, list) or not all(
+            isinstance(value, str) for value in values
+        ):
+            raise ValueError(f"{path}: {key} must be a list of strings")
+    return values
+
+
+def _scan_top_level_list(path: str, key: str) -> Optional[List[str]]:
+    """
+    Scans the event stream of a YAML file for a list of strings under a
+    top-level key.
+
+    Args:
+        path (str): The path to the YAML file.
+        key (str): The top-level key holding the list.
+
+    Returns:
+        Optional[List[str]]: The strings of the list, an empty list if the key
+        is missing, or None if the file needs a full parse.
+    """
+    values = []
+    found = False
+    with open(path, "rb") as file:
+        events = yaml.parse(file, Loader=Loader)
+        depth = 0
+        is_key = True
+        for event in events:
+            if isinstance(event, yaml.CollectionStartEvent):
+                depth += 1
+                if depth == 1 and not isinstance(event, yaml.MappingStartEvent):
+                    return []
+            elif isinstance(event, yaml.CollectionEndEvent):
+                depth -= 1
+                if depth == 0:
+                    break
+                if depth == 1:
+                    is_key = not is_key
+            elif depth == 1 and isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                if is_key:
+                    # aliased or merged keys may hide the key, a repeated
+                    # key overrides the first one
+                    if isinstance(event, yaml.AliasEvent) or event.value == "<<":
+                        return None
+                    if event.value == key:
+                        if found:
+                            return None
+                        found = True
+                        values = _read_scalar_list(events)
+                        if values is None:
+                            return None
+                        # the value is consumed, the next event is a key
+                        continue
+                is_key = not is_key
+    return values
+
+
+_resolver = yaml.resolver.Resolver()
+
+
+def _resolve_tag(event: yaml.ScalarEvent) -> str:
+    """
+    Resolves the tag of a scalar the same way the composer of a full parse does.
+
+    Args:
+        event (yaml.ScalarEvent): The scalar event.
+
+    Returns:
+        str: The resolved tag, eg: "tag:yaml.org,2002:str".
+    """
+    if event.tag is None or event.tag == "!":
+        return _resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+    return event.tag
+
+
+def _read_scalar_list(events) -> Optional[list]:
+    """
+    Reads the value following a key from the event stream, when it is a null
+    or a sequence of strings.
+
+    Args:
+        events: The event stream, positioned right after the key.
+
+    Returns:
+        Optional[list]: The strings of the sequence, an empty list for a null,
+        or None if the value has any other shape and needs a full parse.
+    """
+    event = next(events)
+    if isinstance(event, yaml.ScalarEvent):
+        return [] if _resolve_tag(event) == _NULL_TAG else None
+    if not isinstance(event, yaml.SequenceStartEvent) or event.tag is not None:
+        return None
+    values = []
+    for event in events:
+        if isinstance(event, yaml.SequenceEndEvent):
+            return values
+        if not isinstance(event, yaml.ScalarEvent) or _resolve_tag(event) != _STR_TAG:
+            return None
+        values.append(event.value)
+    return None
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the app modules are imported the same way as with PYTHONPATH=app
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
@@ -0,0 +1,50 @@
+import pytest
+
+from utils.yaml_loader import load_top_level_list, load_yaml
+
+
+def _write(tmp_path, content):
+    path = tmp_path / "job.yml"
+    path.write_text(content)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "tags: [daily, mogi]\nname: x\n",
+        "tags:\n  - daily\n  - mogi\nname: x\n",
+        "name: x\nruns:\n  - suite: s\n    data_assets: [a.b]\ntags: [daily]\n",
+        "tags: ['2024', \"a\"]\n",
+        "tags:\nname: x\n",
+        "tags: ~\n",
+        "name: x\n",
+        "",
+        "x: &A [daily]\ntags: *A\n",
+        "tags: &T [daily]\nname: x\n",
+        "defaults: &D\n  tags: [daily]\nname: x\n<<: *D\n",
+        "tags: [a]\ntags: [b]\n",
+        "tags: !!seq [daily]\n",
+    ],
+)
+def test_load_top_level_list_matches_full_parse(tmp_path, content):
+    path = _write(tmp_path, content)
+    expected = (load_yaml(path) or {}).get("tags") or []
+    assert load_top_level_list(path, "tags") == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "tags: daily\n",
+        "tags: [2024]\n",
+        "tags: [daily, ~]\n",
+        "tags: [daily, [mogi]]\n",
+        "tags: {daily: true}\n",
+        "x: &A daily\ntags: *A\n",
+    ],
+)
+def test_load_top_level_list_rejects_non_string_lists(tmp_path, content):
+    path = _write(tmp_path, content)
+    with pytest.raises(ValueError):
+        load_top_level_list(path, "tags")